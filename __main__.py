@@ -1 +1,138 @@
-from .tools import *
\ No newline at end of file
+#!/usr/bin/env python
+'''Batch extraction of properties from Gaussian16 outputs and formatted checkpoints.
+
+Examples:
+    python -m chemparser -p energy,natoms *.log
+    find . -name '*.log' | python -m chemparser -p status,energy -f csv -j 8
+
+Output files are taken from the arguments or, when none is given (or '-'), one
+per line from stdin. One record per file is streamed to stdout in input order.
+Only the standard library is imported at startup; numpy is loaded by the getters
+that build arrays (e.g. geometry).
+'''
+import sys
+import csv
+import json
+import argparse
+
+from .exceptions import PropertyNotFoundError
+
+# property name -> (GaussianOutput method, description)
+PROPERTIES = {
+    'natoms': ('get_number_of_atoms', 'number of atoms'),
+    'nbasis': ('get_number_of_basis_functions', 'number of basis functions'),
+    'energy': ('get_last_scf_energy', 'last SCF energy (Eh)'),
+    'energies': ('get_scf_energies', 'all SCF energies (Eh)'),
+    'termination': ('get_termination_status', 'normal or error'),
+    'dipole': ('get_dipole', 'dipole moment norm (au)'),
+    'polarizability': ('get_polarizability', 'isotropic and anisotropic polarizability'),
+    'orbitals': ('get_orbitals_energies', 'occupied and virtual orbital energies (Eh)'),
+    'geometry': ('get_last_geometry', 'last geometry as [element, x, y, z] rows'),
+    'status': (None, 'job health triage (status, failing link, imaginary frequencies)'),
+}
+
+FCHK_EXTENSIONS = ('.fchk', '.fch')
+
+def _to_serializable(value):
+    if hasattr(value, 'tolist'):
+        return value.tolist()
+    if isinstance(value, tuple):
+        return [_to_serializable(i) for i in value]
+    return value
+
+def extract_properties(output_file, properties) -> dict:
+    '''Extracts the requested properties from a Gaussian16 output or formatted checkpoint file.
+
+    Args:
+        output_file: path to the Gaussian16 output file (.fchk/.fch files are read
+            with GaussianFormattedCheckpoint)
+        properties: list of property names (keys of PROPERTIES)
+
+    Returns:
+        Dict with the file path and one JSON-serializable value per property. Properties
+        missing from the output (or not available for formatted checkpoints) are None, as
+        are all properties of missing or unreadable files (whose triage status is 'unreadable').
+    '''
+    if output_file.endswith(FCHK_EXTENSIONS):
+        from .parser_fchk import GaussianFormattedCheckpoint
+        gaussian_output = GaussianFormattedCheckpoint(output_file)
+    else:
+        from .parser_gaussian16 import GaussianOutput
+        gaussian_output = GaussianOutput(output_file)
+    record = {'file': output_file}
+    for property_name in properties:
+        if property_name == 'status':
+            if output_file.endswith(FCHK_EXTENSIONS):
+                triage = {'status': None, 'link': None, 'nimag': None}
+            else:
+                from .triage import triage_output
+                triage = triage_output(output_file)
+            record['status'] = triage['status']
+            record['link'] = triage['link']
+            record['nimag'] = triage['nimag']
+            continue
+        method = PROPERTIES[property_name][0]
+        value = None
+        if hasattr(gaussian_output, method):
+            try:
+                value = getattr(gaussian_output, method)()
+            except (PropertyNotFoundError, OSError, IndexError, ValueError):
+                value = None
+        record[property_name] = _to_serializable(value)
+    return record
+
+def _extract_properties(arguments):
+    return extract_properties(*arguments)
+
+def _parse_properties(properties: str) -> list:
+    properties = [i.strip() for i in properties.split(',') if i.strip()]
+    for property_name in properties:
+        if property_name not in PROPERTIES:
+            raise argparse.ArgumentTypeError(f"unknown property '{property_name}' (choose from {', '.join(PROPERTIES)})")
+    return properties
+
+def _read_output_files(files):
+    if not files or files == ['-']:
+        for line in sys.stdin:
+            line = line.strip()
+            if line:
+                yield line
+    else:
+        yield from files
+
+def _write_records(records, output_format, stream):
+    writer = None
+    for record in records:
+        if output_format == 'jsonl':
+            stream.write(json.dumps(record) + '\n')
+        else:
+            if writer is None:
+                writer = csv.DictWriter(stream, fieldnames=list(record))
+                writer.writeheader()
+            writer.writerow({key: json.dumps(value) if isinstance(value, list) else value for key, value in record.items()})
+        stream.flush()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m chemparser',
+        description='Extract properties from Gaussian16 output files.',
+        epilog='properties: ' + ', '.join(f'{name} ({description})' for name, (_, description) in PROPERTIES.items()),
+    )
+    parser.add_argument('files', nargs='*', help="output files (read from stdin when omitted or '-')")
+    parser.add_argument('-p', '--properties', type=_parse_properties, default=['energy'], help='comma-separated properties to extract (default: energy)')
+    parser.add_argument('-f', '--format', default='jsonl', choices=['jsonl', 'csv'], help='output format (default: jsonl)')
+    parser.add_argument('-j', '--jobs', type=int, default=1, help='number of worker processes (default: 1)')
+    args = parser.parse_args(argv)
+
+    output_files = _read_output_files(args.files)
+    if args.jobs > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+            tasks = ((output_file, args.properties) for output_file in output_files)
+            _write_records(executor.map(_extract_properties, tasks, chunksize=16), args.format, sys.stdout)
+    else:
+        records = (extract_properties(output_file, args.properties) for output_file in output_files)
+        _write_records(records, args.format, sys.stdout)
+
+if __name__ == '__main__':
+    main()
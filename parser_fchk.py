@@ -0,0 +1,295 @@
+#!/usr/bin/env python
+import re
+
+from .exceptions import *
+from .tools.tools import atom_from_atomic_number
+
+BOHR_TO_ANGSTROM = 0.52917721092
+
+# number of values per line for each fchk data type
+FCHK_VALUES_PER_LINE = {'I': 6, 'R': 5, 'C': 5, 'L': 72, 'H': 9}
+
+class GaussianFormattedCheckpoint():
+    '''Reader for Gaussian16 formatted checkpoint (.fchk) files.
+
+    The first access scans the file once and records the type, size and byte range of
+    every section; section data is only parsed when requested and then cached. Getters
+    share names and return types with GaussianOutput, so either source can serve a property.
+    '''
+    def __init__(self, output_file):
+        self.output_file = output_file
+        self._sections = None
+        self._cache = dict()
+
+    def _index_sections(self) -> dict:
+        sections = dict()
+        with open(self.output_file, 'rb') as output:
+            # title and job type lines
+            output.readline()
+            output.readline()
+            while True:
+                line = output.readline()
+                if not line:
+                    break
+                line = line.decode()
+                label = re.sub(r'\s+', ' ', line[:40].strip())
+                section_info = line[40:].split()
+                if len(section_info) >= 3 and section_info[1] == 'N=':
+                    data_type = section_info[0]
+                    size = int(section_info[2])
+                    start = output.tell()
+                    number_of_lines = -(-size // FCHK_VALUES_PER_LINE[data_type])
+                    for _ in range(number_of_lines):
+                        output.readline()
+                    sections[label] = (data_type, size, start, output.tell())
+                elif len(section_info) == 2:
+                    sections[label] = (section_info[0], None, section_info[1], None)
+        return sections
+
+    @property
+    def labels(self) -> list:
+        '''Labels of all sections in the file'''
+        if self._sections is None:
+            self._sections = self._index_sections()
+        return list(self._sections)
+
+    def get(self, label):
+        '''Fetches a section of the formatted checkpoint by its label.
+
+        Args:
+            label: section label as written in the file (e.g. 'Alpha Orbital Energies').
+                Repeated blanks are ignored.
+
+        Returns:
+            int, float or str for scalar sections, numpy array for numeric and logical
+            arrays and str for character arrays.
+
+        Raises:
+            PropertyNotFoundError: When the section is not present in the file.
+        '''
+        label = re.sub(r'\s+', ' ', label.strip())
+        if label in self._cache:
+            return self._cache[label]
+        if self._sections is None:
+            self._sections = self._index_sections()
+        if label not in self._sections:
+            raise PropertyNotFoundError(f"Formatted checkpoint does not contain '{label}'")
+
+        data_type, size, start, end = self._sections[label]
+        if size is None:
+            if data_type == 'I':
+                value = int(start)
+            elif data_type == 'R':
+                value = float(start.replace('D', 'E'))
+            elif data_type == 'L':
+                value = start == 'T'
+            else:
+                value = start
+        else:
+            with open(self.output_file, 'rb') as output:
+                output.seek(start)
+                data = output.read(end - start).decode()
+            value = self._parse_array(data, data_type, size)
+        self._cache[label] = value
+        return value
+
+    @staticmethod
+    def _parse_array(data: str, data_type: str, size: int):
+        import numpy as np
+
+        if data_type in ('C', 'H'):
+            return ''.join(data.splitlines()).strip()
+        if data_type == 'L':
+            return np.array(list(''.join(data.split())), dtype='U1') == 'T'
+        dtype = np.int64 if data_type == 'I' else float
+        values = np.fromstring(data, dtype=dtype, sep=' ')
+        if len(values) != size:
+            # fromstring stops silently at malformed numbers, let numpy report them
+            values = np.array(data.replace('D', 'E').split(), dtype=dtype)
+        return values
+
+    def get_number_of_atoms(self) -> int:
+        '''Fetches number of atoms from the formatted checkpoint.
+
+        Args:
+            None
+
+        Returns:
+            The number of atoms in the molecule as int.
+
+        Raises:
+            PropertyNotFoundError: When 'Number of atoms' is not present in the file
+        '''
+        return self.get('Number of atoms')
+
+    def get_number_of_basis_functions(self) -> int:
+        '''Fetches number of basis functions from the formatted checkpoint.
+
+        Args:
+            None
+
+        Returns:
+            The number of basis functions as int.
+
+        Raises:
+            PropertyNotFoundError: When 'Number of basis functions' is not present in the file
+        '''
+        return self.get('Number of basis functions')
+
+    def get_scf_energies(self) -> list:
+        '''Fetches SCF Energies from the formatted checkpoint.
+
+        Args:
+            None
+
+        Returns:
+            Energies of every optimization point when available, otherwise the final SCF Energy, in a list.
+
+        Raises:
+            PropertyNotFoundError: When no SCF Energy is present in the file
+        '''
+        try:
+            # pairs of (energy, RMS gradient) for each optimization point
+            return self.get('Opt point 1 Results for each geome')[::2].tolist()
+        except PropertyNotFoundError:
+            return [self.get_last_scf_energy()]
+
+    def get_last_scf_energy(self) -> float:
+        '''Fetches the final SCF Energy from the formatted checkpoint.
+
+        Args:
+            None
+
+        Returns:
+            Final SCF Energy (float).
+
+        Raises:
+            PropertyNotFoundError: When 'SCF Energy' is not present in the file
+        '''
+        return self.get('SCF Energy')
+
+    def _build_geometry(self, coordinates):
+        import numpy as np
+
+        elements = [atom_from_atomic_number(int(i)) for i in self.get('Atomic numbers')]
+        coordinates = np.asarray(coordinates).reshape(-1, 3) * BOHR_TO_ANGSTROM
+        return np.column_stack([elements, np.char.mod('%.6f', coordinates)])
+
+    def get_geometries(self) -> list:
+        '''Fetches all XYZ Coordinates from the formatted checkpoint.
+
+        Args:
+            None
+
+        Returns:
+            List of numpy arrays containing the geometry of every optimization point (or the
+            current geometry), in the same layout as GaussianOutput.get_geometries
+
+        Raises:
+            PropertyNotFoundError: When no geometry is present in the file
+        '''
+        try:
+            all_coordinates = self.get('Opt point 1 Geometries').reshape(-1, 3 * self.get_number_of_atoms())
+        except PropertyNotFoundError:
+            return [self.get_last_geometry()]
+        return [self._build_geometry(coordinates) for coordinates in all_coordinates]
+
+    def get_last_geometry(self):
+        '''Fetches the current XYZ Coordinates from the formatted checkpoint.
+
+        Args:
+            None
+
+        Returns:
+            Numpy array containing the molecular geometry, in the same layout as GaussianOutput.get_last_geometry
+
+        Raises:
+            PropertyNotFoundError: When 'Current cartesian coordinates' is not present in the file
+        '''
+        return self._build_geometry(self.get('Current cartesian coordinates'))
+
+    def get_orbitals_energies(self) -> tuple:
+        '''Fetches the alpha molecular orbitals energies from the formatted checkpoint.
+
+        Args:
+            None
+
+        Returns:
+            Tuple containing ([occupied_orbs], [empty_orbs]) energies in Eh. The lists are 0-indexed
+
+        Raises:
+            PropertyNotFoundError: When 'Alpha Orbital Energies' is not present in the file.
+        '''
+        orbital_energies = self.get('Alpha Orbital Energies').tolist()
+        number_of_alpha_electrons = self.get('Number of alpha electrons')
+        return (orbital_energies[:number_of_alpha_electrons], orbital_energies[number_of_alpha_electrons:])
+
+    def get_dipole(self) -> float:
+        '''Fetches the dipole magnitude from the formatted checkpoint.
+
+        Args:
+            None
+
+        Returns:
+            Dipole vector norm in atomic units (float), as GaussianOutput.get_dipole
+
+        Raises:
+            PropertyNotFoundError: When 'Dipole Moment' is not present in the file
+        '''
+        import numpy as np
+
+        return float(np.linalg.norm(self.get('Dipole Moment')))
+
+    def get_polarizability(self) -> tuple:
+        '''Fetches the dipole polarizability from the formatted checkpoint.
+
+        Args:
+            None
+
+        Returns:
+            Tuple containing (isotropic_pol, anisotropic_pol) in atomic units, as printed in the
+            Gaussian16 output.
+
+        Raises:
+            PropertyNotFoundError: When 'Polarizability' is not present in the file.
+        '''
+        xx, xy, yy, xz, yz, zz = self.get('Polarizability')
+        isotropic_polarizability = (xx + yy + zz) / 3
+        anisotropic_polarizability = (((xx - yy)**2 + (yy - zz)**2 + (zz - xx)**2 + 6*(xy**2 + yz**2 + xz**2)) / 2) ** 0.5
+        return (float(isotropic_polarizability), float(anisotropic_polarizability))
+
+    def get_gradient(self):
+        '''Fetches the Cartesian gradient from the formatted checkpoint.
+
+        Args:
+            None
+
+        Returns:
+            (n_atoms, 3) numpy array of the energy gradient in Eh/Bohr.
+
+        Raises:
+            PropertyNotFoundError: When 'Cartesian Gradient' is not present in the file.
+        '''
+        return self.get('Cartesian Gradient').reshape(-1, 3)
+
+    def get_density_matrix(self):
+        '''Fetches the total SCF density matrix from the formatted checkpoint.
+
+        Args:
+            None
+
+        Returns:
+            Symmetric (n_basis, n_basis) numpy array. This output is 0-indexed.
+
+        Raises:
+            PropertyNotFoundError: When 'Total SCF Density' is not present in the file.
+        '''
+        import numpy as np
+
+        packed_density = self.get('Total SCF Density')
+        number_of_basis_functions = self.get_number_of_basis_functions()
+        rows, columns = np.tril_indices(number_of_basis_functions)
+        density_matrix = np.zeros((number_of_basis_functions, number_of_basis_functions))
+        density_matrix[rows, columns] = packed_density
+        density_matrix[columns, rows] = packed_density
+        return density_matrix
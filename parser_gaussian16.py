@@ -1,13 +1,92 @@
 #!/usr/bin/env python
 import re
 import os
-
-import numpy as np
+from collections import deque
 
 from .exceptions import *
 from .tools import *
 from .parser_nbo7 import NaturalBondOrbital7
 from .tools.tools import atom_from_atomic_number
+from .tools.fileio import reverse_readlines
+
+TERMINATION_TAIL_LINES = 20
+
+regex_error_link = re.compile(r'Error termination via Lnk1e in \S*?(l[0-9]+)\.exe')
+regex_error_request = re.compile(r'Error termination request processed by link ([0-9]+)')
+
+def parse_termination(tail_lines: list) -> tuple:
+    '''Finds the termination message among the last lines of a Gaussian16 output.
+
+    Args:
+        tail_lines: last lines of the output, in file order. Only the last
+            TERMINATION_TAIL_LINES non-empty lines are considered.
+
+    Returns:
+        Tuple (termination, link) with termination 'normal', 'error' or None (no
+        termination message) and the failing link (e.g. 'l502') or None.
+    '''
+    termination = None
+    link = None
+    for line in [i for i in tail_lines if i.strip()][-TERMINATION_TAIL_LINES:]:
+        if 'Normal termination of Gaussian' in line:
+            termination = 'normal'
+        elif 'Error termination' in line:
+            termination = 'error'
+            found_link = regex_error_link.search(line)
+            found_request = regex_error_request.search(line)
+            if found_link:
+                link = found_link.group(1)
+            elif found_request:
+                link = f'l{found_request.group(1)}'
+    return (termination, link)
+
+# numpy (and the modules depending on it) is imported where it is needed, so that
+# scalar queries do not pay its import time
+def _build_geometry(geometry_rows: list):
+    import numpy as np
+    geometry = np.array(geometry_rows)[:,[1,3,4,5]] # Select only the columns: atomic number and x, y and z coordinates
+    geometry[:,0] = [atom_from_atomic_number(int(i)) for i in geometry[:,0]] # Replace atomic number for element
+    return geometry
+
+def _parse_scf_energies(output) -> list:
+    scf_energies = list()
+    for line in output:
+        if re.search('SCF Done', line):
+            scf_energy = float(line.split()[4])
+            scf_energies.append(scf_energy)
+    return scf_energies
+
+def _read_geometry_rows(output) -> list:
+    # reads the rows of a geometry block, right after its 'Coordinates (Angstroms)' line
+    geometry_rows = list()
+    output.readline()
+    output.readline()
+    while True:
+        current_line = output.readline()
+        if re.search(r'\s-{69}', current_line) or not current_line:
+            break
+        else:
+            geometry_rows.append(current_line.strip().split())
+    return geometry_rows
+
+def _parse_geometries(output) -> list:
+    geometries = list()
+    for line in output:
+        if re.search(r'Coordinates \(Angstroms\)', line):
+            geometries.append(_build_geometry(_read_geometry_rows(output)))
+    return geometries
+
+def _build_path(energies: list, geometry_rows: list, **coordinates) -> dict:
+    import numpy as np
+
+    path = {
+        'elements': [atom_from_atomic_number(int(row[1])) for row in geometry_rows[0]],
+        'energies': np.array(energies),
+        'geometries': np.array([[row[3:6] for row in rows] for rows in geometry_rows], dtype=float),
+    }
+    for name, values in coordinates.items():
+        path[name] = np.array(values, dtype=float)
+    return path
 
 class GaussianOutput(NaturalBondOrbital7):
     def __init__(self,output_file):
@@ -32,11 +111,13 @@ class GaussianOutput(NaturalBondOrbital7):
                     return number_of_atoms
         raise PropertyNotFoundError("Output does not contain number of atoms")
     
-    def get_scf_energies(self) -> list:
+    def get_scf_energies(self, processes=None) -> list:
         '''Fetches SCF Energies from Gaussian16 output file. 
 
         Args:
-            None
+            processes: when given, the output is split into chunks that are parsed on
+                this number of worker processes (for very large outputs). The result is
+                the same as the serial parsing.
 
         Returns:
             All SCF Energies from the output in a list. 
@@ -44,17 +125,59 @@ class GaussianOutput(NaturalBondOrbital7):
         Raises:
             PropertyNotFoundError: When 'SCF Done' is not found on the output file 
         '''
-        scf_energies = list()
-        with open(self.output_file) as output:
-            for line in output:
-                if re.search('SCF Done', line):
-                    scf_energy = float(line.split()[4])
-                    scf_energies.append(scf_energy)
+        if processes:
+            from .tools.chunks import parse_chunks
+            scf_energies = parse_chunks(self.output_file, _parse_scf_energies, b'SCF Done', processes=processes)
+        else:
+            with open(self.output_file) as output:
+                scf_energies = _parse_scf_energies(output)
         if scf_energies:
             return scf_energies
         else:
             raise PropertyNotFoundError("Output does not contain SCF Energy")
 
+    def get_last_scf_energy(self) -> float:
+        '''Fetches the last SCF Energy from Gaussian16 output file. 
+
+        The output is read backwards from its end, so the cost does not depend on the file length.
+
+        Args:
+            None
+
+        Returns:
+            Last SCF Energy from the output (float). 
+
+        Raises:
+            PropertyNotFoundError: When 'SCF Done' is not found on the output file 
+        '''
+        for line in reverse_readlines(self.output_file):
+            if re.search('SCF Done', line):
+                return float(line.split()[4])
+        raise PropertyNotFoundError("Output does not contain SCF Energy")
+
+    def get_termination_status(self) -> str:
+        '''Fetches the termination status from the end of the Gaussian16 output file. 
+
+        Args:
+            None
+
+        Returns:
+            'normal' or 'error' (str). 
+
+        Raises:
+            PropertyNotFoundError: When the output does not end with a termination message (e.g. the job is still running) 
+        '''
+        tail_lines = list()
+        for line in reverse_readlines(self.output_file):
+            if line.strip():
+                tail_lines.append(line)
+                if len(tail_lines) == TERMINATION_TAIL_LINES:
+                    break
+        termination, _ = parse_termination(tail_lines[::-1])
+        if termination:
+            return termination
+        raise PropertyNotFoundError("Output does not contain termination status")
+
     def get_dipole(self) -> float:
         '''Fetches the dipole magnitude from Gaussian16 output file. 
 
@@ -62,7 +185,7 @@ class GaussianOutput(NaturalBondOrbital7):
             None
 
         Returns:
-            Dipole vector norm in Debye (float) 
+            Dipole vector norm in atomic units (float) 
 
         Raises:
             PropertyNotFoundError: When 'Electric dipole moment (input orientation)' is not found on the output file 
@@ -172,6 +295,75 @@ class GaussianOutput(NaturalBondOrbital7):
                         return(occupied_orbitals_eigenvalues, empty_orbitals_eigenvalues)
         raise PropertyNotFoundError("Output does not contain orbitals energies from SCF Density")
 
+    def get_number_of_basis_functions(self) -> int:
+        '''Fetches number of basis functions from Gaussian16 output file. 
+
+        Args:
+            None
+
+        Returns:
+            The number of basis functions as int. 
+
+        Raises:
+            PropertyNotFoundError: When 'basis functions,' is not found on the output file 
+        '''
+        with open(self.output_file) as output:
+            for line in output:
+                if re.search('basis functions,', line):
+                    number_of_basis_functions = int(line.split()[0])
+                    return number_of_basis_functions
+        raise PropertyNotFoundError("Output does not contain number of basis functions")
+
+    def get_overlap_matrix(self):
+        '''Fetches the AO overlap matrix from Gaussian16 output file (printed with iop(3/33=1)). 
+
+        Args:
+            None
+
+        Returns:
+            Symmetric (n_basis, n_basis) numpy array. This output is 0-indexed. 
+
+        Raises:
+            PropertyNotFoundError: When the overlap matrix is not present on the output file. 
+        '''
+        from .tools.matrix import read_block_matrix
+
+        number_of_basis_functions = None
+        with open(self.output_file) as output:
+            for line in output:
+                if number_of_basis_functions is None and re.search('basis functions,', line):
+                    number_of_basis_functions = int(line.split()[0])
+                elif re.search(r'\*\*\* Overlap \*\*\*', line):
+                    return read_block_matrix(output, size=number_of_basis_functions, shape='symmetric')
+        raise PropertyNotFoundError("Output does not contain the overlap matrix")
+
+    def get_density_matrix(self):
+        '''Fetches the last SCF density matrix from Gaussian16 output file (printed with pop=full). 
+
+        Args:
+            None
+
+        Returns:
+            Symmetric (n_basis, n_basis) numpy array. This output is 0-indexed. 
+
+        Raises:
+            PropertyNotFoundError: When the density matrix is not present on the output file. 
+        '''
+        from .tools.matrix import read_block_matrix
+
+        number_of_basis_functions = None
+        density_matrix = None
+        with open(self.output_file) as output:
+            for line in output:
+                if number_of_basis_functions is None and re.search('basis functions,', line):
+                    number_of_basis_functions = int(line.split()[0])
+                elif re.search('^ +Density Matrix:', line):
+                    density_matrix = read_block_matrix(output, size=number_of_basis_functions, shape='symmetric', out=density_matrix)
+        if density_matrix is not None:
+            return density_matrix
+        else:
+            raise PropertyNotFoundError("Output does not contain the density matrix")
+
     def extract_nbo7_output(self) -> list:
         '''Fetches data from NBO7 output within the Gaussian16 output. 
 
@@ -197,6 +389,80 @@ class GaussianOutput(NaturalBondOrbital7):
                             nbo_output.append(current_line)
             raise PropertyNotFoundError("Output does not contain NBO7 output")
 
+    def get_excited_states(self) -> dict:
+        '''Fetches TD-DFT (or CIS/TD-HF) excited states from Gaussian16 output file. 
+
+        When the output holds several excited state calculations, the last one is returned.
+
+        Args:
+            None
+
+        Returns:
+            Dict of 0-indexed arrays, one entry per excited state: 'energies' (eV), 'wavelengths' (nm),
+            'oscillator_strengths', 'rotatory_strengths_velocity' and 'rotatory_strengths_length'
+            (10**-40 erg-esu-cm/Gauss, None when not printed), 'symmetries' (list, e.g. 'Singlet-A')
+            and 'dominant_configurations' (list of (from_orbital, to_orbital, coefficient) tuples for
+            the excitation with the largest coefficient). 
+
+        Raises:
+            PropertyNotFoundError: When no excited state is found in the output file 
+        '''
+        import numpy as np
+
+        regex_excited_state = re.compile(r'Excited State\s+([0-9]+):\s+(\S+)\s+(-?[0-9]+\.[0-9]+) eV\s+(-?[0-9]+\.[0-9]+) nm\s+f=(-?[0-9]+\.[0-9]+)')
+        regex_configuration = re.compile(r'^\s*([0-9]+[AB]?)\s*->\s*([0-9]+[AB]?)\s+(-?[0-9]+\.[0-9]+)')
+        excited_states = list()
+        rotatory_strengths = {'R(velocity)': dict(), 'R(length)': dict()}
+        with open(self.output_file) as output:
+            for line in output:
+                if re.search('Ground to excited state transition electric dipole moments', line):
+                    rotatory_strengths = {'R(velocity)': dict(), 'R(length)': dict()}
+                elif re.search(r'state +XX +YY +ZZ +R\((velocity|length)\)', line):
+                    form = 'R(velocity)' if 'R(velocity)' in line else 'R(length)'
+                    while True:
+                        rotatory_line = output.readline().split()
+                        if len(rotatory_line) >= 5 and rotatory_line[0].isdigit():
+                            rotatory_strengths[form][int(rotatory_line[0])] = float(rotatory_line[4])
+                        else:
+                            break
+                elif re.search('Excitation energies and oscillator strengths:', line):
+                    excited_states = list()
+                else:
+                    excited_state = regex_excited_state.search(line)
+                    if excited_state:
+                        excited_states.append({
+                            'state': int(excited_state.group(1)),
+                            'symmetry': excited_state.group(2),
+                            'energy': float(excited_state.group(3)),
+                            'wavelength': float(excited_state.group(4)),
+                            'oscillator_strength': float(excited_state.group(5)),
+                            'dominant_configuration': None,
+                        })
+                    elif excited_states:
+                        configuration = regex_configuration.search(line)
+                        if configuration:
+                            from_orbital, to_orbital, coefficient = configuration.groups()
+                            dominant_configuration = excited_states[-1]['dominant_configuration']
+                            if dominant_configuration is None or abs(float(coefficient)) > abs(dominant_configuration[2]):
+                                excited_states[-1]['dominant_configuration'] = (from_orbital, to_orbital, float(coefficient))
+        if not excited_states:
+            raise PropertyNotFoundError("Output does not contain excited states")
+
+        states = [excited_state['state'] for excited_state in excited_states]
+        parsed_excited_states = {
+            'energies': np.array([excited_state['energy'] for excited_state in excited_states]),
+            'wavelengths': np.array([excited_state['wavelength'] for excited_state in excited_states]),
+            'oscillator_strengths': np.array([excited_state['oscillator_strength'] for excited_state in excited_states]),
+            'rotatory_strengths_velocity': None,
+            'rotatory_strengths_length': None,
+            'symmetries': [excited_state['symmetry'] for excited_state in excited_states],
+            'dominant_configurations': [excited_state['dominant_configuration'] for excited_state in excited_states],
+        }
+        for form, key in (('R(velocity)', 'rotatory_strengths_velocity'), ('R(length)', 'rotatory_strengths_length')):
+            if rotatory_strengths[form]:
+                parsed_excited_states[key] = np.array([rotatory_strengths[form].get(state, np.nan) for state in states])
+        return parsed_excited_states
+
     def get_nmr_tensors(self):
         '''Fetches NMR Magnetic shielding tensors from Gaussian Output. 
 
@@ -238,11 +504,13 @@ class GaussianOutput(NaturalBondOrbital7):
     def get_thermochemistry(self) -> dict:
         pass
 
-    def get_geometries(self):
+    def get_geometries(self, processes=None):
         '''Fetches al XYZ Coordinates from Gaussian Output. 
 
         Args:
-            None
+            processes: when given, the output is split into chunks that are parsed on
+                this number of worker processes (for very large outputs). The result is
+                the same as the serial parsing.
 
         Returns:
             List of numpy arrays containing the molecular geometries
@@ -250,28 +518,142 @@ class GaussianOutput(NaturalBondOrbital7):
         Raises:
             PropertyNotFoundError: When no geometry is found in the output file 
         '''
-        geometries = list()
-        with open(self.output_file) as output:
-            for line in output:
-                if re.search('Coordinates \(Angstroms\)', line):
-                    current_geometry = list()
-                    output.readline()
-                    output.readline()
-                    while True:
-                        current_line = output.readline()
-                        if re.search('\s-{69}', current_line):
-                            break
-                        else:
-                            current_geometry.append(current_line.strip().split())
-                    current_geometry = np.array(current_geometry)[:,[1,3,4,5]] # Select only the columns: atomic number and x, y and z coordinates
-                    current_geometry[:,0] = [atom_from_atomic_number(int(i)) for i in current_geometry[:,0]] # Replace atomic number for element
-                    geometries.append(current_geometry)
+        if processes:
+            from .tools.chunks import parse_chunks
+            geometries = parse_chunks(self.output_file, _parse_geometries, b'Coordinates (Angstroms)', processes=processes)
+        else:
+            with open(self.output_file) as output:
+                geometries = _parse_geometries(output)
         if geometries:
             return geometries
         else:
             raise PropertyNotFoundError("Output does not contain any geometry information")
 
+    def get_scan_path(self) -> dict:
+        '''Fetches the converged points of a relaxed scan from Gaussian16 output file. 
+
+        The output is read once and only the last geometry and SCF Energy are kept
+        until an 'Optimization completed' message marks them as a converged point.
+        Points whose optimization did not converge are left out.
+
+        Args:
+            None
+
+        Returns:
+            Dict with 'elements' (list), 'energies' (n_points,), 'geometries' (n_points, n_atoms, 3)
+            and 'coordinates' (n_points, n_scanned) holding the values of the scanned
+            coordinates (Angstroms and Degrees), as aligned numpy arrays.
+
+        Raises:
+            PropertyNotFoundError: When no converged optimization point is found in the output file 
+        '''
+        energies, geometry_rows, scan_coordinates = list(), list(), list()
+        last_energy, last_geometry_rows = None, None
+        current_scan_coordinates = None
+        with open(self.output_file) as output:
+            for line in output:
+                if re.search(r'Coordinates \(Angstroms\)', line):
+                    last_geometry_rows = _read_geometry_rows(output)
+                    current_scan_coordinates = None
+                elif re.search('SCF Done', line):
+                    last_energy = float(line.split()[4])
+                elif re.search('Optimization completed', line) and last_energy is not None and last_geometry_rows:
+                    energies.append(last_energy)
+                    geometry_rows.append(last_geometry_rows)
+                    current_scan_coordinates = list()
+                    scan_coordinates.append(current_scan_coordinates)
+                elif current_scan_coordinates is not None and re.search(r'^ *!.*\sScan\s', line):
+                    current_scan_coordinates.append(float(line.split()[3]))
+        if energies:
+            return _build_path(energies, geometry_rows, coordinates=scan_coordinates)
+        else:
+            raise PropertyNotFoundError("Output does not contain converged scan points")
+
+    def get_irc_path(self) -> dict:
+        '''Fetches the converged points of an IRC from Gaussian16 output file. 
+
+        The output is read once and only the last geometry and SCF Energy are kept
+        until the 'NET REACTION COORDINATE' of a converged point is printed. The first
+        geometry of the output is taken as the transition state (reaction coordinate 0).
+
+        Args:
+            None
+
+        Returns:
+            Dict with 'elements' (list), 'energies' (n_points,), 'geometries' (n_points, n_atoms, 3)
+            and 'reaction_coordinate' (n_points,), as aligned numpy arrays sorted along the path. 
+            Points of the reverse path have negative reaction coordinates.
 
+        Raises:
+            PropertyNotFoundError: When no IRC point is found in the output file 
+        '''
+        import numpy as np
+
+        energies, geometry_rows, reaction_coordinate = list(), list(), list()
+        last_energy, last_geometry_rows = None, None
+        path_number = 1
+        with open(self.output_file) as output:
+            for line in output:
+                if re.search(r'Coordinates \(Angstroms\)', line):
+                    last_geometry_rows = _read_geometry_rows(output)
+                elif re.search('SCF Done', line):
+                    last_energy = float(line.split()[4])
+                    if not energies and last_geometry_rows:
+                        # transition state
+                        energies.append(last_energy)
+                        geometry_rows.append(last_geometry_rows)
+                        reaction_coordinate.append(0.0)
+                elif re.search('Path Number:', line):
+                    path_number = int(line.split()[-1])
+                elif re.search('NET REACTION COORDINATE UP TO THIS POINT', line) and energies:
+                    net_reaction_coordinate = float(line.split()[-1])
+                    energies.append(last_energy)
+                    geometry_rows.append(last_geometry_rows)
+                    reaction_coordinate.append(-net_reaction_coordinate if path_number == 2 else net_reaction_coordinate)
+        if len(energies) > 1:
+            order = np.argsort(reaction_coordinate, kind='stable')
+            return _build_path(
+                [energies[i] for i in order],
+                [geometry_rows[i] for i in order],
+                reaction_coordinate=[reaction_coordinate[i] for i in order],
+            )
+        else:
+            raise PropertyNotFoundError("Output does not contain IRC points")
+
+    def get_last_geometry(self):
+        '''Fetches the last XYZ Coordinates from Gaussian Output. 
+
+        The output is read backwards from its end and reading stops as soon as the
+        last geometry block is complete. The number of atoms ('NAtoms=') bounds the
+        number of lines kept in memory.
+
+        Args:
+            None
+
+        Returns:
+            Numpy array containing the last molecular geometry
+
+        Raises:
+            PropertyNotFoundError: When no geometry or number of atoms is found in the output file 
+        '''
+        try:
+            number_of_atoms = self.get_number_of_atoms()
+        except PropertyNotFoundError:
+            raise PropertyNotFoundError("Output does not contain number of atoms, required to read the last geometry")
+        # lines following the current one in forward order: column names, dashes, atoms and dashes
+        following_lines = deque(maxlen=number_of_atoms + 3)
+        for line in reverse_readlines(self.output_file):
+            if re.search(r'Coordinates \(Angstroms\)', line):
+                current_geometry = list()
+                for current_line in list(following_lines)[2:]:
+                    if re.search(r'\s-{69}', current_line):
+                        if current_geometry:
+                            return _build_geometry(current_geometry)
+                        break
+                    else:
+                        current_geometry.append(current_line.strip().split())
+            following_lines.appendleft(line)
+        raise PropertyNotFoundError("Output does not contain any geometry information")
 
     def write_geometry(self):
         pass
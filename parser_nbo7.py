@@ -1,8 +1,96 @@
 import os
 import re
+import operator
 
 from .exceptions import *
 
+NBO_TYPES = ('CR', 'LP', 'LV', 'BD', 'BD*', '3C', '3C*', '3Cn', 'RY', 'RY*')
+NBO_TYPE_CODES = {nbo_type: code for code, nbo_type in enumerate(NBO_TYPES)}
+NBO_RYDBERG_TYPES = ('RY', 'RY*', 'LV')
+REGEX_NPA = re.compile(r'([A-Z][a-z]?)\s{0,2}([0-9]{1,3})\s*(-?[0-9]*\.[0-9]*)\s*(-?[0-9]*\.[0-9]*)\s*(-?[0-9]*\.[0-9]*)\s*(-?[0-9]*\.[0-9]*)\s*(-?[0-9]*\.[0-9]*)')
+NPA_DTYPE = [
+    ('atom', 'U3'),
+    ('atom_number', 'i4'),
+    ('natural_charge', 'f8'),
+    ('core_population', 'f8'),
+    ('valence_population', 'f8'),
+    ('rydberg_population', 'f8'),
+    ('total_population', 'f8'),
+]
+
+class NaturalBondOrbitalTable():
+    '''Compact column-wise container of natural bond orbitals.
+
+    Orbital types are stored as int8 codes into NBO_TYPES. The participant atoms and
+    the delocalizations of orbital i are the slices [indptr[i]:indptr[i+1]] of the flat
+    participants / delocalizations arrays (CSR layout). Delocalizations are stored as the
+    acceptor NBO number plus its kind ('g'eminal, 'v'icinal or 'r'emote).
+    Indexing the table returns the same dict as NaturalBondOrbital7.get_natural_bond_orbitals.
+    '''
+    __slots__ = (
+        'numbers', 'type_codes', 'bond_orders', 'occupancies', 'energies',
+        'participants_indptr', 'participants',
+        'delocalizations_indptr', 'delocalizations', 'delocalization_kinds',
+    )
+
+    def __init__(self, numbers, type_codes, bond_orders, occupancies, energies,
+                 participants_indptr, participants,
+                 delocalizations_indptr, delocalizations, delocalization_kinds):
+        self.numbers = numbers
+        self.type_codes = type_codes
+        self.bond_orders = bond_orders
+        self.occupancies = occupancies
+        self.energies = energies
+        self.participants_indptr = participants_indptr
+        self.participants = participants
+        self.delocalizations_indptr = delocalizations_indptr
+        self.delocalizations = delocalizations
+        self.delocalization_kinds = delocalization_kinds
+
+    def __len__(self):
+        return len(self.numbers)
+
+    def _normalize_index(self, index) -> int:
+        index = operator.index(index)
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(f"NBO index out of range for a table of {len(self)} orbitals")
+        return index
+
+    def __getitem__(self, index):
+        index = self._normalize_index(index)
+        participants_slice = slice(self.participants_indptr[index], self.participants_indptr[index+1])
+        delocalizations_slice = slice(self.delocalizations_indptr[index], self.delocalizations_indptr[index+1])
+        return {
+            'nbo_number': int(self.numbers[index]),
+            'nbo_type': NBO_TYPES[self.type_codes[index]],
+            'nbo_bond_order': int(self.bond_orders[index]),
+            'nbo_occupancy': float(self.occupancies[index]),
+            'nbo_energy': float(self.energies[index]),
+            'nbo_participants': self.participants[participants_slice].tolist(),
+            'nbo_delocalizations': [f'{number}({kind})' for number, kind in zip(
+                self.delocalizations[delocalizations_slice].tolist(),
+                self.delocalization_kinds[delocalizations_slice].tolist()
+            )],
+        }
+
+    @property
+    def types(self):
+        '''Orbital types as an array of strings'''
+        import numpy as np
+        return np.array(NBO_TYPES)[self.type_codes]
+
+    def get_participants(self, index):
+        '''Participant atoms (1-indexed) of the orbital at the given 0-indexed position'''
+        index = self._normalize_index(index)
+        return self.participants[self.participants_indptr[index]:self.participants_indptr[index+1]]
+
+    def get_delocalizations(self, index):
+        '''Acceptor NBO numbers of the delocalizations of the orbital at the given 0-indexed position'''
+        index = self._normalize_index(index)
+        return self.delocalizations[self.delocalizations_indptr[index]:self.delocalizations_indptr[index+1]]
+
 class NaturalBondOrbital7():
     #TODO -> split alpha and betha outputs when multiplicity != singlet
     def __init__(self,output_file):
@@ -25,7 +113,6 @@ class NaturalBondOrbital7():
             natural_population_analysis = list()
             for line in output:
                 if re.search('Summary of Natural Population Analysis', line):
-                    regex_npa = re.compile(r'([A-Z][a-z]?)\s{0,2}([0-9]{1,3})\s*(-?[0-9]*\.[0-9]*)\s*(-?[0-9]*\.[0-9]*)\s*(-?[0-9]*\.[0-9]*)\s*(-?[0-9]*\.[0-9]*)\s*(-?[0-9]*\.[0-9]*)')
                     for _ in range(5):
                         output.readline()
                     while True:
@@ -33,7 +120,7 @@ class NaturalBondOrbital7():
                         if re.search('={68}', current_line):
                             break
                         else:
-                            current_atom_npa = regex_npa.findall(current_line)[0]
+                            current_atom_npa = REGEX_NPA.findall(current_line)[0]
                             atom_natural_population = {
                                 'atom': str(current_atom_npa[0]),
                                 'atom_number': int(current_atom_npa[1]),
@@ -111,6 +198,112 @@ class NaturalBondOrbital7():
                     all_nbo_parsed[-1]['nbo_delocalizations'].append(delocalization)
         return all_nbo_parsed
 
+    def get_natural_population_analysis_array(self):
+        '''Fetches natural population analysis table from NBO7 output as a structured array 
+
+        Args:
+            None
+
+        Returns:
+            Structured numpy array (fields in NPA_DTYPE) with one record per atom. This
+            output is 0-indexed.  
+
+        Raises:
+            PropertyNotFoundError: When NPA analysis is not present in the output. 
+        '''
+        import numpy as np
+
+        natural_population_analysis = list()
+        with open(self.output_file) as output:
+            for line in output:
+                if re.search('Summary of Natural Population Analysis', line):
+                    for _ in range(5):
+                        output.readline()
+                    while True:
+                        current_line = output.readline()
+                        if re.search('={68}', current_line):
+                            break
+                        else:
+                            natural_population_analysis.append(REGEX_NPA.search(current_line).groups())
+        if natural_population_analysis:
+            return np.array(natural_population_analysis, dtype=NPA_DTYPE)
+        else:
+            raise PropertyNotFoundError("Output does not contain NPA analysis")
+
+    def get_natural_bond_orbitals_table(self, skip_rydberg=False) -> NaturalBondOrbitalTable:
+        '''Fetches natural orbitals from NBO7 output into a compact table. 
+
+        Lines are parsed as they are read, without keeping the raw summary in memory.
+
+        Args:
+            skip_rydberg: when True, Rydberg (RY, RY*) and lone vacancy (LV) orbitals are
+                discarded during parsing
+
+        Returns:
+            NaturalBondOrbitalTable with the parsed natural bond orbitals (0-indexed).  
+
+        Raises:
+            PropertyNotFoundError: When NBO orbitals are not present in the output. 
+        '''
+        import numpy as np
+
+        regex_nbo_parser = re.compile(r'^\s*([0-9]+)\.\s*(BD\*|BD|CR|LP|LV|RY\*|RY|3C\*|3Cn|3C)\s*\(\s*([0-9]+)\)(.*?)\s(-?[0-9]+\.[0-9]+)\s+(-?[0-9]+\.[0-9]+)(.*)$')
+        regex_participants = re.compile(r'[A-Za-z]+\s*([0-9]+)')
+        regex_delocalizations = re.compile(r'([0-9]+)\(([gvr])\)')
+
+        numbers, type_codes, bond_orders, occupancies, energies = list(), list(), list(), list(), list()
+        participants, participants_indptr = list(), [0]
+        delocalizations, delocalization_kinds, delocalizations_indptr = list(), list(), [0]
+        with open(self.output_file) as output:
+            for line in output:
+                if re.search(r'NATURAL BOND ORBITALS \(Summary\):', line):
+                    for _ in range(6):
+                        output.readline()
+                    skipping = False
+                    for current_line in output:
+                        if 'NBO analysis completed' in current_line:
+                            break
+                        nbo_string_parsed = regex_nbo_parser.match(current_line)
+                        if nbo_string_parsed:
+                            nbo_type = nbo_string_parsed.group(2)
+                            skipping = skip_rydberg and nbo_type in NBO_RYDBERG_TYPES
+                            if skipping:
+                                continue
+                            numbers.append(int(nbo_string_parsed.group(1)))
+                            type_codes.append(NBO_TYPE_CODES[nbo_type])
+                            bond_orders.append(int(nbo_string_parsed.group(3)))
+                            occupancies.append(float(nbo_string_parsed.group(5)))
+                            energies.append(float(nbo_string_parsed.group(6)))
+                            participants.extend(regex_participants.findall(nbo_string_parsed.group(4)))
+                            participants_indptr.append(len(participants))
+                            delocalizations_line = nbo_string_parsed.group(7)
+                        elif numbers and not skipping:
+                            delocalizations_line = current_line
+                        else:
+                            continue
+                        if '(' in delocalizations_line:
+                            for number, kind in regex_delocalizations.findall(delocalizations_line):
+                                delocalizations.append(number)
+                                delocalization_kinds.append(kind)
+                        # closes (or extends, for continuation lines) the delocalizations of the last orbital
+                        delocalizations_indptr[len(numbers):] = [len(delocalizations)]
+
+        if not numbers:
+            raise PropertyNotFoundError("Output does not contain NBO Orbitals Summary")
+
+        return NaturalBondOrbitalTable(
+            numbers=np.array(numbers, dtype=np.int32),
+            type_codes=np.array(type_codes, dtype=np.int8),
+            bond_orders=np.array(bond_orders, dtype=np.int16),
+            occupancies=np.array(occupancies, dtype=float),
+            energies=np.array(energies, dtype=float),
+            participants_indptr=np.array(participants_indptr, dtype=np.int64),
+            participants=np.array(participants, dtype=np.int32),
+            delocalizations_indptr=np.array(delocalizations_indptr, dtype=np.int64),
+            delocalizations=np.array(delocalizations, dtype=np.int32),
+            delocalization_kinds=np.array(delocalization_kinds, dtype='U1'),
+        )
+
     def get_perturbation_analysis(self):
         '''
         '''
@@ -168,6 +361,48 @@ class NaturalBondOrbital7():
 
 
 
+    def get_wiberg_bond_index_matrix(self):
+        '''Fetches the Wiberg bond index matrix in the NAO basis from NBO7 output. 
+
+        Args:
+            None
+
+        Returns:
+            Symmetric (n_atoms, n_atoms) numpy array of Wiberg bond indexes. This
+            output is 0-indexed.  
+
+        Raises:
+            PropertyNotFoundError: When the Wiberg bond index matrix is not present in the output. 
+        '''
+        from .tools.matrix import read_block_matrix
+
+        with open(self.output_file) as output:
+            for line in output:
+                if re.search('Wiberg bond index matrix in the NAO basis:', line):
+                    return read_block_matrix(output, shape='full')
+        raise PropertyNotFoundError("Output does not contain Wiberg bond index matrix")
+
+    def get_overlap_weighted_nao_bond_orders(self):
+        '''Fetches the atom-atom overlap-weighted NAO bond order matrix from NBO7 output. 
+
+        Args:
+            None
+
+        Returns:
+            Symmetric (n_atoms, n_atoms) numpy array of NAO bond orders. This
+            output is 0-indexed.  
+
+        Raises:
+            PropertyNotFoundError: When the overlap-weighted NAO bond orders are not present in the output. 
+        '''
+        from .tools.matrix import read_block_matrix
+
+        with open(self.output_file) as output:
+            for line in output:
+                if re.search('Atom-atom overlap-weighted NAO bond order:', line):
+                    return read_block_matrix(output, shape='full')
+        raise PropertyNotFoundError("Output does not contain overlap-weighted NAO bond orders")
+
     @staticmethod
     def parse_nbo_participants(self, nbo_string):
         # regular expressions 
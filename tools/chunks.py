@@ -0,0 +1,78 @@
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+CHUNK_SIZE = 64 * 1024 * 1024
+
+def _next_marker_line(file, offset: int, marker: bytes) -> int:
+    file.seek(offset)
+    if offset > 0:
+        file.readline() # move to the start of the next line
+    while True:
+        line_start = file.tell()
+        line = file.readline()
+        if not line or marker in line:
+            return line_start
+
+def find_chunk_boundaries(file_path, marker: bytes, number_of_chunks: int) -> list:
+    '''Splits a text file into byte ranges that start at lines containing a marker.
+
+    Nominal split points are spread evenly over the file and each one is moved
+    forward to the beginning of the next line containing the marker, so that no
+    section starting at a marker line is cut between two chunks.
+
+    Args:
+        file_path: path to the file
+        marker: bytes identifying the first line of a section
+        number_of_chunks: number of nominal chunks
+
+    Returns:
+        Sorted list of byte offsets, starting at 0 and ending at the file size.
+        Consecutive offsets delimit one chunk.
+    '''
+    with open(file_path, 'rb') as file:
+        file_size = file.seek(0, os.SEEK_END)
+        boundaries = [0]
+        for i in range(1, number_of_chunks):
+            boundary = _next_marker_line(file, i * file_size // number_of_chunks, marker)
+            if boundary > boundaries[-1]:
+                boundaries.append(boundary)
+    if file_size > boundaries[-1]:
+        boundaries.append(file_size)
+    return boundaries
+
+def _parse_chunk(arguments):
+    file_path, start, end, parser = arguments
+    with open(file_path, 'rb') as file:
+        file.seek(start)
+        chunk = file.read(end - start)
+    return parser(io.StringIO(chunk.decode(errors='replace'), newline=None))
+
+def parse_chunks(file_path, parser, marker: bytes, processes=None, chunk_size=CHUNK_SIZE) -> list:
+    '''Parses one large text file in parallel, chunk by chunk.
+
+    The file is split with find_chunk_boundaries, each chunk is given to parser as a
+    file-like object on a process pool and the returned lists are concatenated in
+    file order. The result matches parser applied to the whole file as long as
+    every section parser looks for starts at a marker line.
+
+    Args:
+        file_path: path to the file
+        parser: picklable (module-level) function taking a file object and returning a list
+        marker: bytes identifying the first line of a section
+        processes: number of worker processes (defaults to the number of CPUs)
+        chunk_size: approximate maximum chunk size in bytes
+
+    Returns:
+        Concatenated list of parsed results.
+    '''
+    processes = processes or os.cpu_count() or 1
+    file_size = os.path.getsize(file_path)
+    number_of_chunks = max(processes, -(-file_size // chunk_size))
+    boundaries = find_chunk_boundaries(file_path, marker, number_of_chunks)
+    chunks = [(file_path, start, end, parser) for start, end in zip(boundaries[:-1], boundaries[1:])]
+    results = list()
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        for chunk_results in executor.map(_parse_chunk, chunks):
+            results.extend(chunk_results)
+    return results
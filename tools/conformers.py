@@ -0,0 +1,133 @@
+import bisect
+
+import numpy as np
+
+from .geometry import kabsch_rmsd, stack_geometries
+
+HARTREE_TO_KCAL = 627.509474
+ENERGY_WINDOW = 0.5 / HARTREE_TO_KCAL
+RMSD_THRESHOLD = 0.125
+FINGERPRINT_BIN_WIDTH = 0.1
+
+def distance_fingerprints(coordinates, bin_width=FINGERPRINT_BIN_WIDTH, block_size=1024):
+    '''Computes rotation and permutation invariant fingerprints of conformers.
+
+    The fingerprint of a conformer is the cumulative normalized histogram of all its
+    interatomic distances, with bins of bin_width Angstrom shared by all conformers.
+    The L1 difference of two fingerprints times bin_width approximates (within bin_width)
+    the mean shift between their sorted interatomic distances.
+
+    Args:
+        coordinates: (n_conformers, n_atoms, 3) array
+        bin_width: histogram bin width in Angstrom
+        block_size: number of conformers processed at once, to bound memory use
+
+    Returns:
+        (n_conformers, n_bins) array of cumulative histograms, each ending at 1.
+    '''
+    coordinates = np.asarray(coordinates, dtype=float)
+    number_of_conformers, number_of_atoms = coordinates.shape[:2]
+    first, second = np.triu_indices(number_of_atoms, k=1)
+    number_of_pairs = len(first)
+
+    def block_distances(start):
+        block = coordinates[start:start+block_size]
+        return np.linalg.norm(block[:,first] - block[:,second], axis=-1)
+
+    # first pass: the longest distance over all blocks sets the number of shared bins
+    starts = range(0, number_of_conformers, block_size)
+    max_distance = max((block_distances(start).max(initial=0.0) for start in starts), default=0.0)
+    number_of_bins = int(max_distance / bin_width) + 1
+
+    # second pass: one bincount per block, each conformer using its own range of bins
+    fingerprints = np.empty((number_of_conformers, number_of_bins))
+    for start in starts:
+        bins = (block_distances(start) / bin_width).astype(np.int64)
+        offsets = np.arange(len(bins))[:,None] * number_of_bins
+        counts = np.bincount((bins + offsets).ravel(), minlength=len(bins) * number_of_bins)
+        fingerprints[start:start+block_size] = np.cumsum(counts.reshape(len(bins), number_of_bins), axis=1)
+    return fingerprints / max(number_of_pairs, 1)
+
+def deduplicate_conformers(energies, coordinates, energy_window=ENERGY_WINDOW, rmsd_threshold=RMSD_THRESHOLD,
+                           fingerprint_tolerance=None, bin_width=FINGERPRINT_BIN_WIDTH) -> tuple:
+    '''Clusters duplicate conformers of the same molecule.
+
+    Conformers are visited from the lowest to the highest energy. Each one is compared
+    only with the representatives found so far within energy_window of it and, among
+    those, only with the ones whose sorted interatomic distances (estimated from the
+    distance fingerprints) differ on average by at most fingerprint_tolerance. The aligned
+    (Kabsch) RMSD is computed for the remaining candidates: below rmsd_threshold the
+    conformer joins the closest representative, otherwise it becomes a new representative.
+    Atoms must be in the same order in every conformer.
+
+    Args:
+        energies: (n_conformers,) energies in Eh
+        coordinates: (n_conformers, n_atoms, 3) array in Angstrom
+        energy_window: maximum energy difference between duplicates (Eh)
+        rmsd_threshold: maximum aligned RMSD between duplicates (Angstrom)
+        fingerprint_tolerance: maximum mean distance shift between duplicates (Angstrom).
+            The default, 2 * rmsd_threshold + bin_width, never discards a pair within
+            rmsd_threshold, since each interatomic distance changes at most by the sum of
+            the displacements of its two atoms.
+        bin_width: fingerprint histogram bin width (Angstrom)
+
+    Returns:
+        Tuple (labels, representatives). labels[i] is the index of the representative of
+        conformer i and representatives holds the indices of the unique conformers,
+        sorted by energy. Both are 0-indexed on the input order.
+    '''
+    energies = np.asarray(energies, dtype=float)
+    coordinates = np.asarray(coordinates, dtype=float)
+    fingerprints = distance_fingerprints(coordinates, bin_width=bin_width)
+    if fingerprint_tolerance is None:
+        fingerprint_tolerance = 2 * rmsd_threshold + bin_width
+
+    labels = np.empty(len(energies), dtype=np.int64)
+    representatives = list()
+    representative_energies = list()
+    for conformer in np.argsort(energies, kind='stable'):
+        first_candidate = bisect.bisect_left(representative_energies, energies[conformer] - energy_window)
+        candidates = np.array(representatives[first_candidate:], dtype=np.int64)
+        if len(candidates):
+            fingerprint_difference = bin_width * np.abs(fingerprints[candidates] - fingerprints[conformer]).sum(axis=1)
+            candidates = candidates[fingerprint_difference <= fingerprint_tolerance]
+        if len(candidates):
+            rmsd = kabsch_rmsd(coordinates[conformer], coordinates[candidates])
+            closest = np.argmin(rmsd)
+            if rmsd[closest] <= rmsd_threshold:
+                labels[conformer] = candidates[closest]
+                continue
+        labels[conformer] = conformer
+        representatives.append(conformer)
+        representative_energies.append(energies[conformer])
+    return (labels, np.array(representatives, dtype=np.int64))
+
+def _load_conformer(output_file):
+    from ..parser_gaussian16 import GaussianOutput
+
+    gaussian_output = GaussianOutput(output_file)
+    return (gaussian_output.get_last_scf_energy(), gaussian_output.get_last_geometry())
+
+def load_conformers(output_files, processes=None) -> tuple:
+    '''Reads the final energy and geometry of a batch of Gaussian16 outputs.
+
+    Only the end of each output is read (see GaussianOutput.get_last_scf_energy and
+    GaussianOutput.get_last_geometry).
+
+    Args:
+        output_files: list of paths to Gaussian16 output files of the same molecule
+        processes: number of worker processes. With None or 1 the files are read serially.
+
+    Returns:
+        Tuple (elements, energies, coordinates) with the element symbols, a (n_conformers,)
+        array of energies in Eh and a (n_conformers, n_atoms, 3) array in Angstrom.
+    '''
+    if processes and processes > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            conformers = list(executor.map(_load_conformer, output_files, chunksize=16))
+    else:
+        conformers = [_load_conformer(output_file) for output_file in output_files]
+    elements, coordinates = stack_geometries([geometry for _, geometry in conformers])
+    energies = np.array([energy for energy, _ in conformers])
+    return (elements, energies, coordinates)
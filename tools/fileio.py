@@ -0,0 +1,74 @@
+import os
+
+BLOCK_SIZE = 65536
+
+def reverse_readlines(file_path, block_size=BLOCK_SIZE):
+    '''Yields the lines of a text file from the last to the first one.
+
+    The file is read backwards in binary blocks starting at EOF, so the cost of
+    consuming only the last lines does not depend on the file length.
+
+    Args:
+        file_path: path to the file
+        block_size: number of bytes read per block
+
+    Yields:
+        Decoded lines (without trailing newline), last line first.
+    '''
+    with open(file_path, 'rb') as file:
+        position = file.seek(0, os.SEEK_END)
+        remainder = b''
+        while position > 0:
+            read_size = min(block_size, position)
+            position -= read_size
+            file.seek(position)
+            lines = (file.read(read_size) + remainder).split(b'\n')
+            # the first piece may be the tail of a line that starts in the previous block
+            remainder = lines.pop(0)
+            for line in reversed(lines):
+                yield line.rstrip(b'\r').decode(errors='replace')
+        yield remainder.rstrip(b'\r').decode(errors='replace')
+
+def read_head(file_path, size=BLOCK_SIZE) -> list:
+    '''Reads the complete lines within the first bytes of a text file.
+
+    Args:
+        file_path: path to the file
+        size: number of bytes read from the beginning of the file
+
+    Returns:
+        List of decoded lines (without trailing newline).
+    '''
+    with open(file_path, 'rb') as file:
+        data = file.read(size)
+        # drop the last line when it continues beyond the block
+        complete = len(data) < size or file.read(1) == b''
+    lines = data.decode(errors='replace').splitlines()
+    if not complete and not data.endswith(b'\n'):
+        lines = lines[:-1]
+    return lines
+
+def read_tail(file_path, size=BLOCK_SIZE) -> list:
+    '''Reads the complete lines within the last bytes of a text file.
+
+    Args:
+        file_path: path to the file
+        size: number of bytes read from the end of the file
+
+    Returns:
+        List of decoded lines (without trailing newline), in file order.
+    '''
+    with open(file_path, 'rb') as file:
+        file_size = file.seek(0, os.SEEK_END)
+        position = max(0, file_size - size)
+        # read one extra byte to know whether the block starts at a line boundary
+        file.seek(max(0, position - 1))
+        data = file.read()
+    if position > 0:
+        starts_at_line = data[:1] == b'\n'
+        data = data[1:]
+        lines = data.decode(errors='replace').splitlines()
+        if not starts_at_line:
+            lines = lines[1:]
+        return lines
+    return data.decode(errors='replace').splitlines()
@@ -0,0 +1,192 @@
+import itertools
+
+import numpy as np
+
+from .tools import covalent_radius
+
+BOND_TOLERANCE = 0.45
+CELL_LIST_THRESHOLD = 1000
+
+def geometry_to_arrays(geometry) -> tuple:
+    '''Splits a geometry as returned by GaussianOutput.get_geometries into elements and coordinates.
+
+    Args:
+        geometry: (n_atoms, 4) array of [element, x, y, z] rows
+
+    Returns:
+        Tuple (elements, coordinates) with a list of element symbols and a (n_atoms, 3) float array.
+    '''
+    geometry = np.asarray(geometry)
+    return (geometry[:,0].tolist(), geometry[:,1:].astype(float))
+
+def stack_geometries(geometries) -> tuple:
+    '''Stacks the geometries of a trajectory into a single coordinates array.
+
+    Args:
+        geometries: list of (n_atoms, 4) arrays of [element, x, y, z] rows, all with the same atoms
+
+    Returns:
+        Tuple (elements, coordinates) with the element symbols of the first frame and a
+        (n_frames, n_atoms, 3) float array.
+    '''
+    elements = geometry_to_arrays(geometries[0])[0]
+    coordinates = np.array([np.asarray(geometry)[:,1:] for geometry in geometries], dtype=float)
+    return (elements, coordinates)
+
+def distance_matrix(coordinates):
+    '''Computes the pairwise interatomic distances of one or many frames.
+
+    Args:
+        coordinates: (..., n_atoms, 3) array
+
+    Returns:
+        (..., n_atoms, n_atoms) array of distances.
+    '''
+    coordinates = np.asarray(coordinates, dtype=float)
+    differences = coordinates[...,:,None,:] - coordinates[...,None,:,:]
+    return np.sqrt(np.einsum('...ijk,...ijk->...ij', differences, differences))
+
+def _bonded_pairs(coordinates, radii, first, second, tolerance):
+    differences = coordinates[first][:,None,:] - coordinates[second][None,:,:]
+    distances = np.sqrt(np.einsum('ijk,ijk->ij', differences, differences))
+    cutoffs = radii[first][:,None] + radii[second][None,:] + tolerance
+    i, j = np.nonzero((distances <= cutoffs) & (first[:,None] < second[None,:]))
+    return np.column_stack([first[i], second[j]])
+
+def connectivity(elements, coordinates, tolerance=BOND_TOLERANCE):
+    '''Perceives the bonds of a geometry from covalent radii.
+
+    Two atoms are bonded when their distance is at most the sum of their covalent radii
+    plus tolerance. Ghost (Bq) and dummy (X) atoms have a covalent radius of 0 and are
+    skipped, so they are never bonded. Geometries with more than CELL_LIST_THRESHOLD atoms
+    are split into cubic cells as large as the longest possible bond, so that only atoms
+    in neighbouring cells are compared and the cost grows linearly with the number of atoms.
+
+    Args:
+        elements: list of element symbols
+        coordinates: (n_atoms, 3) array in Angstrom
+        tolerance: distance added to the sum of covalent radii (Angstrom)
+
+    Returns:
+        (n_bonds, 2) int array of 0-indexed atom pairs (i < j), sorted.
+    '''
+    coordinates = np.asarray(coordinates, dtype=float)
+    radii = np.array([covalent_radius(element) for element in elements])
+    atoms = np.flatnonzero(radii > 0)
+    if len(atoms) <= CELL_LIST_THRESHOLD:
+        bonds = _bonded_pairs(coordinates, radii, atoms, atoms, tolerance)
+    else:
+        cell_size = 2 * radii.max() + tolerance
+        cells = np.floor((coordinates[atoms] - coordinates[atoms].min(axis=0)) / cell_size).astype(np.int64)
+        order = np.lexsort(cells.T[::-1])
+        unique_cells, starts, counts = np.unique(cells[order], axis=0, return_index=True, return_counts=True)
+        order = atoms[order]
+        cell_atoms = {tuple(cell): order[start:start+count] for cell, start, count in zip(unique_cells.tolist(), starts, counts)}
+        offsets = list(itertools.product((-1, 0, 1), repeat=3))
+        bonds = list()
+        for cell, first in cell_atoms.items():
+            neighbours = [cell_atoms.get((cell[0]+dx, cell[1]+dy, cell[2]+dz)) for dx, dy, dz in offsets]
+            second = np.concatenate([i for i in neighbours if i is not None])
+            bonds.append(_bonded_pairs(coordinates, radii, first, second, tolerance))
+        bonds = np.concatenate(bonds)
+    bonds = bonds[np.lexsort(bonds.T[::-1])]
+    return bonds.astype(np.int64).reshape(-1, 2)
+
+def bond_lengths(coordinates, bonds):
+    '''Measures bond lengths in one or many frames at once.
+
+    Args:
+        coordinates: (..., n_atoms, 3) array
+        bonds: (n_bonds, 2) array of 0-indexed atom pairs
+
+    Returns:
+        (..., n_bonds) array of distances.
+    '''
+    coordinates = np.asarray(coordinates, dtype=float)
+    bonds = np.asarray(bonds)
+    return np.linalg.norm(coordinates[...,bonds[:,0],:] - coordinates[...,bonds[:,1],:], axis=-1)
+
+def bond_angles(coordinates, angles):
+    '''Measures angles in one or many frames at once.
+
+    Args:
+        coordinates: (..., n_atoms, 3) array
+        angles: (n_angles, 3) array of 0-indexed atoms (i, j, k), j being the vertex
+
+    Returns:
+        (..., n_angles) array of angles in degrees.
+    '''
+    coordinates = np.asarray(coordinates, dtype=float)
+    angles = np.asarray(angles)
+    first = coordinates[...,angles[:,0],:] - coordinates[...,angles[:,1],:]
+    second = coordinates[...,angles[:,2],:] - coordinates[...,angles[:,1],:]
+    cosines = np.einsum('...i,...i', first, second) / (np.linalg.norm(first, axis=-1) * np.linalg.norm(second, axis=-1))
+    return np.degrees(np.arccos(np.clip(cosines, -1, 1)))
+
+def dihedral_angles(coordinates, dihedrals):
+    '''Measures dihedral angles in one or many frames at once.
+
+    Args:
+        coordinates: (..., n_atoms, 3) array
+        dihedrals: (n_dihedrals, 4) array of 0-indexed atoms (i, j, k, l)
+
+    Returns:
+        (..., n_dihedrals) array of dihedral angles in degrees, in (-180, 180].
+    '''
+    coordinates = np.asarray(coordinates, dtype=float)
+    dihedrals = np.asarray(dihedrals)
+    b0 = coordinates[...,dihedrals[:,0],:] - coordinates[...,dihedrals[:,1],:]
+    b1 = coordinates[...,dihedrals[:,2],:] - coordinates[...,dihedrals[:,1],:]
+    b2 = coordinates[...,dihedrals[:,3],:] - coordinates[...,dihedrals[:,2],:]
+    b1 = b1 / np.linalg.norm(b1, axis=-1)[...,None]
+    v = b0 - np.einsum('...i,...i', b0, b1)[...,None] * b1
+    w = b2 - np.einsum('...i,...i', b2, b1)[...,None] * b1
+    x = np.einsum('...i,...i', v, w)
+    y = np.einsum('...i,...i', np.cross(b1, v), w)
+    return np.degrees(np.arctan2(y, x))
+
+def kabsch_rmsd(coordinates_a, coordinates_b):
+    '''Computes the RMSD after optimal superposition (Kabsch) of pairs of frames.
+
+    Leading dimensions are broadcast, so a single reference can be compared with a
+    whole trajectory ((n_atoms, 3) against (n_frames, n_atoms, 3)). Atoms must be in
+    the same order in both sets of coordinates. The RMSD is obtained from the singular
+    values of the covariance matrices, without building the rotated coordinates.
+
+    Args:
+        coordinates_a: (..., n_atoms, 3) array
+        coordinates_b: (..., n_atoms, 3) array
+
+    Returns:
+        Array of RMSD values with the broadcast leading shape (float for two single frames).
+    '''
+    coordinates_a = np.asarray(coordinates_a, dtype=float)
+    coordinates_b = np.asarray(coordinates_b, dtype=float)
+    coordinates_a = coordinates_a - coordinates_a.mean(axis=-2, keepdims=True)
+    coordinates_b = coordinates_b - coordinates_b.mean(axis=-2, keepdims=True)
+    covariance = np.einsum('...ni,...nj->...ij', coordinates_a, coordinates_b)
+    u, singular_values, vt = np.linalg.svd(covariance)
+    # reflections are not allowed: flip the smallest singular value when det(U V^T) < 0
+    singular_values[...,-1] *= np.sign(np.linalg.det(u) * np.linalg.det(vt))
+    squared_deviation = (np.einsum('...ni,...ni->...', coordinates_a, coordinates_a)
+        + np.einsum('...ni,...ni->...', coordinates_b, coordinates_b)
+        - 2 * singular_values.sum(axis=-1))
+    return np.sqrt(np.maximum(squared_deviation, 0) / coordinates_a.shape[-2])
+
+def rmsd_matrix(coordinates, block_size=256):
+    '''Computes the aligned (Kabsch) RMSD between all pairs of frames of a trajectory.
+
+    Args:
+        coordinates: (n_frames, n_atoms, 3) array
+        block_size: number of rows computed at once, to bound memory use
+
+    Returns:
+        Symmetric (n_frames, n_frames) array of RMSD values.
+    '''
+    coordinates = np.asarray(coordinates, dtype=float)
+    number_of_frames = len(coordinates)
+    rmsd = np.zeros((number_of_frames, number_of_frames))
+    for start in range(0, number_of_frames, block_size):
+        block = coordinates[start:start+block_size]
+        rmsd[start:start+block_size] = kabsch_rmsd(block[:,None], coordinates[None,:])
+    return rmsd
@@ -0,0 +1,96 @@
+import numpy as np
+
+MATRIX_SHAPES = ('full', 'lower', 'symmetric')
+
+def _is_column_header(tokens: list) -> bool:
+    if tokens and tokens[0] == 'Atom':
+        tokens = tokens[1:]
+    return bool(tokens) and all(token.isdigit() for token in tokens)
+
+def _row_index(token: str):
+    token = token.rstrip('.')
+    if token.isdigit():
+        return int(token)
+    return None
+
+def read_block_matrix(output, size=None, shape='full', out=None) -> np.ndarray:
+    '''Reads a matrix printed in column blocks (Gaussian and NBO style).
+
+    The file object must be positioned right after the matrix title line. Each
+    block starts with a header line holding the 1-indexed column numbers
+    (optionally preceded by 'Atom', as NBO does), followed by one line per row
+    whose first token is the 1-indexed row number and whose last tokens are the
+    values. Dashed separators and blank lines between blocks are skipped and
+    Fortran 'D' exponents are accepted. Reading stops at the first line that is
+    neither a header nor a row.
+
+    Values are collected as strings and converted in a single call, then
+    scattered into the matrix with fancy indexing, so the cost per element is
+    independent of the block width.
+
+    Args:
+        output: file object positioned after the matrix title
+        size: matrix dimension. If None, it is inferred from the largest row/column
+            index found.
+        shape: 'full' when every block prints all rows, 'lower' for lower-triangular
+            blocks and 'symmetric' for lower-triangular blocks mirrored into the
+            upper triangle
+        out: optional preallocated (size, size) float array to be filled
+
+    Returns:
+        The matrix as a 0-indexed numpy array.
+
+    Raises:
+        ValueError: When the shape is unknown, no matrix element is found or an
+            index exceeds the matrix size.
+    '''
+    if shape not in MATRIX_SHAPES:
+        raise ValueError(f"Matrix shape must be one of {MATRIX_SHAPES}, got '{shape}'")
+    triangular = shape != 'full'
+
+    rows = list()
+    columns = list()
+    values = list()
+    block_columns = list()
+    for line in output:
+        tokens = line.split()
+        if not tokens or not line.strip(' -\n'):
+            continue
+        if _is_column_header(tokens):
+            block_columns = [int(i) - 1 for i in tokens if i.isdigit()]
+            continue
+        row = _row_index(tokens[0])
+        if row is None or not block_columns:
+            break
+        row -= 1
+        if triangular:
+            row_columns = [i for i in block_columns if i <= row]
+        else:
+            row_columns = block_columns
+        n_values = len(row_columns)
+        if n_values == 0 or len(tokens) <= n_values:
+            break
+        rows.extend([row] * n_values)
+        columns.extend(row_columns)
+        values.extend(tokens[-n_values:])
+
+    if not values:
+        raise ValueError("No matrix elements found")
+
+    rows = np.array(rows, dtype=np.intp)
+    columns = np.array(columns, dtype=np.intp)
+    values = np.array([value.replace('D', 'E') for value in values], dtype=float)
+
+    if out is not None:
+        matrix = out
+    else:
+        if size is None:
+            size = int(max(rows.max(), columns.max())) + 1
+        matrix = np.zeros((size, size))
+    if max(rows.max(), columns.max()) >= matrix.shape[0]:
+        raise ValueError(f"Matrix index exceeds the matrix size ({matrix.shape[0]})")
+
+    matrix[rows, columns] = values
+    if shape == 'symmetric':
+        matrix[columns, rows] = values
+    return matrix
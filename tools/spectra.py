@@ -0,0 +1,100 @@
+import numpy as np
+
+EV_TO_NM = 1239.84198
+HARTREE_TO_KJ_MOL = 2625.49964
+GAS_CONSTANT = 8.314462618e-3 # kJ/(mol K)
+LINESHAPES = ('gaussian', 'lorentzian')
+BLOCK_ELEMENTS = 2**24
+
+def energy_to_wavelength(energies):
+    '''Converts energies in eV to wavelengths in nm (and vice versa)'''
+    return EV_TO_NM / np.asarray(energies, dtype=float)
+
+def pad_transitions(transitions: list):
+    '''Stacks per-conformer transition arrays of different lengths into one array.
+
+    Args:
+        transitions: list of 1D arrays (e.g. excitation energies or strengths of each conformer)
+
+    Returns:
+        (n_conformers, max_n_states) array padded with NaN, which broaden_spectra ignores.
+    '''
+    padded = np.full((len(transitions), max(len(i) for i in transitions)), np.nan)
+    for i, transition in enumerate(transitions):
+        padded[i,:len(transition)] = transition
+    return padded
+
+def boltzmann_weights(energies, temperature=298.15):
+    '''Computes Boltzmann populations of conformers.
+
+    Args:
+        energies: (n_conformers,) energies in Eh (e.g. Gibbs free energies)
+        temperature: temperature in K
+
+    Returns:
+        (n_conformers,) array of populations summing to 1.
+    '''
+    energies = np.asarray(energies, dtype=float)
+    relative_energies = (energies - energies.min()) * HARTREE_TO_KJ_MOL
+    weights = np.exp(-relative_energies / (GAS_CONSTANT * temperature))
+    return weights / weights.sum()
+
+def _lineshape(displacements, fwhm, lineshape):
+    if lineshape == 'gaussian':
+        sigma = fwhm / (2 * np.sqrt(2 * np.log(2)))
+        return np.exp(-0.5 * (displacements / sigma)**2) / (sigma * np.sqrt(2 * np.pi))
+    else:
+        gamma = fwhm / 2
+        return gamma / (np.pi * (displacements**2 + gamma**2))
+
+def broaden_spectra(transition_energies, intensities, grid, fwhm=0.3, lineshape='gaussian', weights=None):
+    '''Broadens stick spectra of any number of conformers on a shared energy grid.
+
+    Each transition contributes intensity times an area-normalized line shape, so the
+    spectrum integrates to the sum of the intensities. All spectra are evaluated at once
+    with broadcasting, in blocks of spectra to bound memory use. NaN transitions (padding,
+    see pad_transitions) are ignored.
+
+    Args:
+        transition_energies: (n_states,) or (n_spectra, n_states) array, same unit as grid (e.g. eV)
+        intensities: array of the same shape (oscillator or rotatory strengths)
+        grid: (n_points,) energies where the spectra are evaluated
+        fwhm: full width at half maximum of the line shape, same unit as grid
+        lineshape: 'gaussian' or 'lorentzian'
+        weights: optional (n_spectra,) weights (e.g. boltzmann_weights) to average the spectra
+
+    Returns:
+        (n_spectra, n_points) array of spectra, (n_points,) for a single spectrum or when
+        weights are given.
+
+    Raises:
+        ValueError: When the line shape is unknown or the shapes do not match.
+    '''
+    if lineshape not in LINESHAPES:
+        raise ValueError(f"Line shape must be one of {LINESHAPES}, got '{lineshape}'")
+    transition_energies = np.asarray(transition_energies, dtype=float)
+    intensities = np.asarray(intensities, dtype=float)
+    grid = np.asarray(grid, dtype=float)
+    if transition_energies.shape != intensities.shape:
+        raise ValueError(f"Transition energies {transition_energies.shape} and intensities {intensities.shape} must have the same shape")
+    single_spectrum = transition_energies.ndim == 1
+    transition_energies = np.atleast_2d(transition_energies)
+    intensities = np.atleast_2d(intensities)
+
+    missing = np.isnan(transition_energies) | np.isnan(intensities)
+    transition_energies = np.where(missing, 0.0, transition_energies)
+    intensities = np.where(missing, 0.0, intensities)
+
+    number_of_spectra, number_of_states = transition_energies.shape
+    block_size = max(1, BLOCK_ELEMENTS // max(1, number_of_states * len(grid)))
+    spectra = np.empty((number_of_spectra, len(grid)))
+    for start in range(0, number_of_spectra, block_size):
+        block = slice(start, start + block_size)
+        profiles = _lineshape(grid[None,None,:] - transition_energies[block,:,None], fwhm, lineshape)
+        spectra[block] = np.einsum('bs,bsg->bg', intensities[block], profiles)
+
+    if weights is not None:
+        return np.asarray(weights, dtype=float) @ spectra
+    if single_spectrum:
+        return spectra[0]
+    return spectra
@@ -1,103 +1,105 @@
 #!/usr/bin/env python
 
+# covalent radii in Angstrom from Cordero et al., Dalton Trans. 2008, 2832 (low-spin values for Mn, Fe and Co);
+# ghost (Bq) and dummy (X) atoms have a covalent radius of 0 and are never bonded
 periodic_table = {
-    'Bq': {},
-    'H': {},
-    'He': {},
-    'Li': {},
-    'Be': {},
-    'B': {},
-    'C': {},
-    'N': {},
-    'O': {},
-    'F': {},
-    'Ne': {},
-    'Na': {},
-    'Mg': {},
-    'Al': {},
-    'Si': {},
-    'P': {},
-    'S': {},
-    'Cl': {},
-    'Ar': {},
-    'K': {},
-    'Ca': {},
-    'Sc': {},
-    'Ti': {},
-    'V': {},
-    'Cr': {},
-    'Mn': {},
-    'Fe': {},
-    'Co': {},
-    'Ni': {},
-    'Cu': {},
-    'Zn': {},
-    'Ga': {},
-    'Ge': {},
-    'As': {},
-    'Se': {},
-    'Br': {},
-    'Kr': {},
-    'Rb': {},
-    'Sr': {},
-    'Y': {},
-    'Zr': {},
-    'Nb': {},
-    'Mo': {},
-    'Tc': {},
-    'Ru': {},
-    'Rh': {},
-    'Pd': {},
-    'Ag': {},
-    'Cd': {},
-    'In': {},
-    'Sn': {},
-    'Sb': {},
-    'Te': {},
-    'I': {},
-    'Xe': {},
-    'Cs': {},
-    'Ba': {},
-    'La': {},
-    'Ce': {},
-    'Pr': {},
-    'Nd': {},
-    'Pm': {},
-    'Sm': {},
-    'Eu': {},
-    'Gd': {},
-    'Tb': {},
-    'Dy': {},
-    'Ho': {},
-    'Er': {},
-    'Tm': {},
-    'Yb': {},
-    'Lu': {},
-    'Hf': {},
-    'Ta': {},
-    'W': {},
-    'Re': {},
-    'Os': {},
-    'Ir': {},
-    'Pt': {},
-    'Au': {},
-    'Hg': {},
-    'Tl': {},
-    'Pb': {},
-    'Bi': {},
-    'Po': {},
-    'At': {},
-    'Rn': {},
-    'Fr': {},
-    'Ra': {},
-    'Ac': {},
-    'Th': {},
-    'Pa': {},
-    'U': {},
-    'Np': {},
-    'Pu': {},
-    'Am': {},
-    'Cm': {},
+    'Bq': {'covalent_radius': 0.0},
+    'H': {'covalent_radius': 0.31},
+    'He': {'covalent_radius': 0.28},
+    'Li': {'covalent_radius': 1.28},
+    'Be': {'covalent_radius': 0.96},
+    'B': {'covalent_radius': 0.84},
+    'C': {'covalent_radius': 0.76},
+    'N': {'covalent_radius': 0.71},
+    'O': {'covalent_radius': 0.66},
+    'F': {'covalent_radius': 0.57},
+    'Ne': {'covalent_radius': 0.58},
+    'Na': {'covalent_radius': 1.66},
+    'Mg': {'covalent_radius': 1.41},
+    'Al': {'covalent_radius': 1.21},
+    'Si': {'covalent_radius': 1.11},
+    'P': {'covalent_radius': 1.07},
+    'S': {'covalent_radius': 1.05},
+    'Cl': {'covalent_radius': 1.02},
+    'Ar': {'covalent_radius': 1.06},
+    'K': {'covalent_radius': 2.03},
+    'Ca': {'covalent_radius': 1.76},
+    'Sc': {'covalent_radius': 1.70},
+    'Ti': {'covalent_radius': 1.60},
+    'V': {'covalent_radius': 1.53},
+    'Cr': {'covalent_radius': 1.39},
+    'Mn': {'covalent_radius': 1.39},
+    'Fe': {'covalent_radius': 1.32},
+    'Co': {'covalent_radius': 1.26},
+    'Ni': {'covalent_radius': 1.24},
+    'Cu': {'covalent_radius': 1.32},
+    'Zn': {'covalent_radius': 1.22},
+    'Ga': {'covalent_radius': 1.22},
+    'Ge': {'covalent_radius': 1.20},
+    'As': {'covalent_radius': 1.19},
+    'Se': {'covalent_radius': 1.20},
+    'Br': {'covalent_radius': 1.20},
+    'Kr': {'covalent_radius': 1.16},
+    'Rb': {'covalent_radius': 2.20},
+    'Sr': {'covalent_radius': 1.95},
+    'Y': {'covalent_radius': 1.90},
+    'Zr': {'covalent_radius': 1.75},
+    'Nb': {'covalent_radius': 1.64},
+    'Mo': {'covalent_radius': 1.54},
+    'Tc': {'covalent_radius': 1.47},
+    'Ru': {'covalent_radius': 1.46},
+    'Rh': {'covalent_radius': 1.42},
+    'Pd': {'covalent_radius': 1.39},
+    'Ag': {'covalent_radius': 1.45},
+    'Cd': {'covalent_radius': 1.44},
+    'In': {'covalent_radius': 1.42},
+    'Sn': {'covalent_radius': 1.39},
+    'Sb': {'covalent_radius': 1.39},
+    'Te': {'covalent_radius': 1.38},
+    'I': {'covalent_radius': 1.39},
+    'Xe': {'covalent_radius': 1.40},
+    'Cs': {'covalent_radius': 2.44},
+    'Ba': {'covalent_radius': 2.15},
+    'La': {'covalent_radius': 2.07},
+    'Ce': {'covalent_radius': 2.04},
+    'Pr': {'covalent_radius': 2.03},
+    'Nd': {'covalent_radius': 2.01},
+    'Pm': {'covalent_radius': 1.99},
+    'Sm': {'covalent_radius': 1.98},
+    'Eu': {'covalent_radius': 1.98},
+    'Gd': {'covalent_radius': 1.96},
+    'Tb': {'covalent_radius': 1.94},
+    'Dy': {'covalent_radius': 1.92},
+    'Ho': {'covalent_radius': 1.92},
+    'Er': {'covalent_radius': 1.89},
+    'Tm': {'covalent_radius': 1.90},
+    'Yb': {'covalent_radius': 1.87},
+    'Lu': {'covalent_radius': 1.87},
+    'Hf': {'covalent_radius': 1.75},
+    'Ta': {'covalent_radius': 1.70},
+    'W': {'covalent_radius': 1.62},
+    'Re': {'covalent_radius': 1.51},
+    'Os': {'covalent_radius': 1.44},
+    'Ir': {'covalent_radius': 1.41},
+    'Pt': {'covalent_radius': 1.36},
+    'Au': {'covalent_radius': 1.36},
+    'Hg': {'covalent_radius': 1.32},
+    'Tl': {'covalent_radius': 1.45},
+    'Pb': {'covalent_radius': 1.46},
+    'Bi': {'covalent_radius': 1.48},
+    'Po': {'covalent_radius': 1.40},
+    'At': {'covalent_radius': 1.50},
+    'Rn': {'covalent_radius': 1.50},
+    'Fr': {'covalent_radius': 2.60},
+    'Ra': {'covalent_radius': 2.21},
+    'Ac': {'covalent_radius': 2.15},
+    'Th': {'covalent_radius': 2.06},
+    'Pa': {'covalent_radius': 2.00},
+    'U': {'covalent_radius': 1.96},
+    'Np': {'covalent_radius': 1.90},
+    'Pu': {'covalent_radius': 1.87},
+    'Am': {'covalent_radius': 1.80},
+    'Cm': {'covalent_radius': 1.69},
     'Bk': {},
     'Cf': {},
     'Es': {},
@@ -120,7 +122,7 @@ periodic_table = {
     'Uuh': {},
     'Uus': {},
     'Uuo': {},
-    'X': {},
+    'X': {'covalent_radius': 0.0},
 }
 
 def atom_from_atomic_number(atomic_number: int) -> str:
@@ -140,5 +142,8 @@ def electron_counter(element_list:list) -> int:
             raise KeyError(f"Element {element} not found in the Period Table")
     return electron_count
 
-
-
+def covalent_radius(atom: str) -> float:
+    if 'covalent_radius' in periodic_table.get(atom, {}):
+        return periodic_table[atom]['covalent_radius']
+    else:
+        raise KeyError(f"Covalent radius of element {atom} not found in the Period Table")
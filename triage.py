@@ -0,0 +1,125 @@
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+from .tools.fileio import read_head, read_tail, BLOCK_SIZE
+from .parser_gaussian16 import parse_termination
+
+TRIAGE_STATUSES = ('normal', 'imaginary_frequencies', 'scf_convergence_failure', 'error', 'running', 'unreadable')
+TAIL_SIZE = 4 * BLOCK_SIZE
+
+regex_nimag = re.compile(r'NImag=([0-9]+)')
+regex_imaginary_frequencies = re.compile(r'\*+ +([0-9]+) imaginary frequencies')
+
+def _get_route(head_lines: list) -> str:
+    for i, line in enumerate(head_lines):
+        if line.strip().startswith('#'):
+            route = list()
+            for route_line in head_lines[i:]:
+                if re.search('^ *-+ *$', route_line):
+                    break
+                route.append(route_line.strip())
+            return ''.join(route)
+    return ''
+
+def _get_archive(tail_lines: list) -> str:
+    for i in range(len(tail_lines) - 1, -1, -1):
+        stripped_line = tail_lines[i].strip()
+        if stripped_line.startswith('1\\1\\') or stripped_line.startswith('1|1|'):
+            archive = list()
+            for archive_line in tail_lines[i:]:
+                archive.append(archive_line.strip())
+                if archive_line.rstrip().endswith('@'):
+                    break
+            return ''.join(archive)
+    return ''
+
+def _count_imaginary_frequencies(output_file):
+    number_of_imaginary_frequencies = 0
+    with open(output_file) as output:
+        for line in output:
+            if 'imaginary frequencies' in line:
+                found = regex_imaginary_frequencies.search(line)
+                if found:
+                    number_of_imaginary_frequencies = int(found.group(1))
+    return number_of_imaginary_frequencies
+
+def triage_output(output_file, head_size=BLOCK_SIZE, tail_size=TAIL_SIZE) -> dict:
+    '''Classifies the health of a Gaussian16 job from its output file.
+
+    Only the first and last blocks of the file are read. The number of imaginary
+    frequencies is taken from the archive entry at the end of the output; the whole
+    file is scanned only when the route requests frequencies and no archive entry is found.
+
+    Args:
+        output_file: path to the Gaussian16 output file
+        head_size: number of bytes read from the beginning of the file
+        tail_size: number of bytes read from the end of the file
+
+    Returns:
+        Dict with keys 'file', 'status' (one of TRIAGE_STATUSES), 'link' (failing link,
+        e.g. 'l502', or None) and 'nimag' (number of imaginary frequencies or None).
+        Outputs without a termination message (running or killed jobs) are 'running' and
+        missing or unreadable files are 'unreadable'.
+    '''
+    triage = {
+        'file': output_file,
+        'status': 'running',
+        'link': None,
+        'nimag': None,
+    }
+    try:
+        tail_lines = read_tail(output_file, tail_size)
+        termination, triage['link'] = parse_termination(tail_lines)
+
+        if termination == 'error':
+            triage['status'] = 'error'
+            for line in tail_lines:
+                if 'Convergence failure -- run terminated.' in line or 'Convergence criterion not met' in line:
+                    triage['status'] = 'scf_convergence_failure'
+                    break
+        elif termination == 'normal':
+            triage['status'] = 'normal'
+            found_nimag = regex_nimag.search(_get_archive(tail_lines))
+            if found_nimag:
+                triage['nimag'] = int(found_nimag.group(1))
+            elif re.search('freq', _get_route(read_head(output_file, head_size)), re.IGNORECASE):
+                triage['nimag'] = _count_imaginary_frequencies(output_file)
+            if triage['nimag']:
+                triage['status'] = 'imaginary_frequencies'
+    except OSError:
+        triage.update({'status': 'unreadable', 'link': None, 'nimag': None})
+    return triage
+
+def triage_outputs(output_files, processes=None, chunksize=16) -> list:
+    '''Classifies the health of many Gaussian16 jobs on a process pool.
+
+    Args:
+        output_files: iterable of paths to Gaussian16 output files
+        processes: number of worker processes (defaults to the number of CPUs).
+            With processes=1 the files are classified serially.
+        chunksize: number of files sent to a worker at a time
+
+    Returns:
+        List of triage dicts (see triage_output) in the same order as output_files.
+    '''
+    output_files = list(output_files)
+    if processes == 1 or len(output_files) <= 1:
+        return [triage_output(output_file) for output_file in output_files]
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        return list(executor.map(triage_output, output_files, chunksize=chunksize))
+
+def format_triage_table(triages: list) -> str:
+    '''Formats triage dicts as a compact whitespace-separated table.
+
+    Args:
+        triages: list of dicts returned by triage_output/triage_outputs
+
+    Returns:
+        Table (str) with one line per file and the columns status, link, nimag and file.
+    '''
+    table = [f"{'status':<24} {'link':<6} {'nimag':>5}  file"]
+    for triage in triages:
+        link = triage['link'] or '-'
+        nimag = '-' if triage['nimag'] is None else triage['nimag']
+        table.append(f"{triage['status']:<24} {link:<6} {nimag:>5}  {triage['file']}")
+    return '\n'.join(table)